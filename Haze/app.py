@@ -1,15 +1,52 @@
+import gc
 import os
 import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import diskcache
+import orjson
+from cachetools import LFUCache
 from flask import Flask, render_template, request, jsonify, flash, redirect, url_for
+from flask.json.provider import JSONProvider
+from markupsafe import Markup
+from werkzeug.exceptions import RequestEntityTooLarge
 from phonetic_fuzzer import PhoneticFuzzer, Hazer
+import haze_worker
 
 # Configure logging
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=logging.INFO)
+# Skip per-request access log lines from the development server
+logging.getLogger('werkzeug').setLevel(logging.WARNING)
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider that uses orjson for request parsing and jsonify()."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping the str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
 
 # Create the app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 app.secret_key = os.environ.get("SESSION_SECRET", "dev-secret-key-change-in-production")
 
+# Maximum number of characters accepted for hazing
+MAX_INPUT_LENGTH = 5000
+
+# Reject oversized bodies before Werkzeug buffers and parses them. Each
+# character can take up to 12 bytes once percent-encoded in a form, plus
+# some room for the other fields.
+app.config['MAX_CONTENT_LENGTH'] = MAX_INPUT_LENGTH * 12 + 4 * 1024
+
 # Initialize the phonetic fuzzer and hazer
 fuzzer = PhoneticFuzzer()
 hazer = Hazer()
@@ -23,6 +60,153 @@ LANGUAGES = {
     'italian': 'Italian',
     'portuguese': 'Portuguese'
 }
+LANGUAGE_KEYS = frozenset(LANGUAGES)
+
+# Hazing methods; anything else is rejected before it reaches the caches
+METHODS = frozenset({'hybrid', 'fuzzy', 'translate'})
+
+def _is_choice(value, choices):
+    """Whether a request value is one of the allowed strings (JSON may send lists)."""
+    return isinstance(value, str) and value in choices
+
+# Load the word lists (and their phonetic indexes) before gunicorn (--preload)
+# forks workers, so every worker shares one copy-on-write copy instead of
+# downloading its own
+HAZE_PRELOAD = os.environ.get("HAZE_PRELOAD", "1") == "1"
+if HAZE_PRELOAD:
+    hazer.preload_languages(LANGUAGES)
+    # Keep the garbage collector from touching (and so copying) shared pages
+    gc.freeze()
+
+# Resolve the page template once instead of on every render
+INDEX_TEMPLATE = app.jinja_env.get_template('index.html')
+
+def _render_language_options(selected):
+    """Pre-render the <option> list for a language dropdown."""
+    return Markup(''.join(
+        f'<option value="{key}"{" selected" if key == selected else ""}>{name}</option>'
+        for key, name in LANGUAGES.items()
+    ))
+
+# Dropdown HTML for every possible selection (None = nothing selected)
+LANGUAGE_OPTIONS = {key: _render_language_options(key) for key in [None, *LANGUAGES]}
+
+def render_index(lang_a=None, lang_b=None, **context):
+    """Render the main page with pre-rendered language dropdowns."""
+    return render_template(INDEX_TEMPLATE,
+                           lang_a=lang_a,
+                           lang_b=lang_b,
+                           lang_a_options=LANGUAGE_OPTIONS.get(lang_a, LANGUAGE_OPTIONS[None]),
+                           lang_b_options=LANGUAGE_OPTIONS.get(lang_b, LANGUAGE_OPTIONS[None]),
+                           **context)
+
+# Number of hazer results kept in memory (0 disables caching)
+HAZE_CACHE_SIZE = int(os.environ.get("HAZE_CACHE_SIZE", "4096"))
+
+# Processes used for hazing so CPU-bound matching is not serialized by
+# the GIL (1, the default, runs the hazer in the request thread). Opt-in:
+# every pool process keeps its own hazer memos, and os.cpu_count() reports
+# the host's cores inside containers.
+HAZE_PROCESSES = int(os.environ.get("HAZE_PROCESSES", "1"))
+
+# forkserver forks pool processes from a clean single-threaded server
+_POOL_START_METHOD = ('forkserver' if 'forkserver' in multiprocessing.get_all_start_methods()
+                      else 'spawn')
+
+_haze_pool = None
+_haze_pool_lock = threading.Lock()
+
+def get_haze_pool():
+    """Return this process's hazing pool, creating it on first use.
+
+    The pool is created lazily so gunicorn workers forked from a preloaded
+    app each get their own pool instead of sharing the parent's queues.
+    This happens while request threads are running, so pool processes are
+    not forked from the worker: a forked child would inherit any lock held
+    at that moment (the hazer's memo locks, the translation slots) and
+    block on it forever. Each pool process builds its own hazer instead.
+    """
+    global _haze_pool
+    with _haze_pool_lock:
+        if _haze_pool is None:
+            _haze_pool = ProcessPoolExecutor(max_workers=HAZE_PROCESSES,
+                                             mp_context=multiprocessing.get_context(_POOL_START_METHOD),
+                                             initializer=haze_worker.init_worker,
+                                             initargs=(tuple(LANGUAGES) if HAZE_PRELOAD else (),))
+        return _haze_pool
+
+def _discard_haze_pool(pool):
+    """Drop a broken pool so the next get_haze_pool() call starts a new one."""
+    global _haze_pool
+    with _haze_pool_lock:
+        if _haze_pool is pool:
+            _haze_pool = None
+    pool.shutdown(wait=False)
+
+def _pooled_haze(input_text, lang_a, lang_b, method):
+    """Run the hazer in the process pool, replacing the pool if it broke.
+
+    A pool process that dies (e.g. killed for memory) leaves the whole
+    pool unusable, so the request is retried once on a fresh pool.
+    """
+    pool = get_haze_pool()
+    try:
+        return pool.submit(haze_worker.pool_haze, input_text, lang_a, lang_b, method).result()
+    except BrokenProcessPool:
+        logging.warning("Hazing pool broke; restarting it")
+        _discard_haze_pool(pool)
+        return get_haze_pool().submit(haze_worker.pool_haze, input_text, lang_a, lang_b, method).result()
+
+# Optional on-disk cache directory, shared by all worker processes and kept
+# across restarts so fresh deploys start warm
+HAZE_CACHE_DIR = os.environ.get("HAZE_CACHE_DIR")
+disk_cache = diskcache.Cache(HAZE_CACHE_DIR) if HAZE_CACHE_DIR else None
+# Part of every disk cache key; bump it when the shape of hazer results
+# changes so entries written by older versions are ignored
+DISK_CACHE_FORMAT = 3
+# Seconds a result is kept in the disk cache
+HAZE_CACHE_TTL = int(os.environ.get("HAZE_CACHE_TTL", str(7 * 24 * 3600)))
+
+# LFU keeps frequently repeated inputs cached even when bursts of
+# one-off submissions would push them out of an LRU cache
+haze_cache = LFUCache(maxsize=HAZE_CACHE_SIZE)
+_haze_cache_lock = threading.Lock()
+_haze_cache_stats = {'hits': 0, 'misses': 0}
+
+def cached_haze(input_text, lang_a, lang_b, method):
+    """Run the hazer through the result caches, keyed on the exact input.
+
+    Misses in the in-memory cache fall back to the disk cache (if
+    configured) before running the hazer. Degraded results, produced while
+    the translator or the LLM was failing, are returned but not cached, so
+    the input is hazed again once the services recover. The returned dict
+    is shared between requests and must not be mutated.
+    """
+    key = (input_text, lang_a, lang_b, method)
+    with _haze_cache_lock:
+        results = haze_cache.get(key)
+        _haze_cache_stats['misses' if results is None else 'hits'] += 1
+    if results is not None:
+        return results
+
+    disk_key = (DISK_CACHE_FORMAT, *key)
+    results = disk_cache.get(disk_key) if disk_cache is not None else None
+    if results is None:
+        if HAZE_PROCESSES <= 1:
+            results = haze_worker.run_haze(hazer, input_text, lang_a, lang_b, method)
+        else:
+            results = _pooled_haze(input_text, lang_a, lang_b, method)
+        if results.get('degraded'):
+            return results
+        if disk_cache is not None:
+            disk_cache.set(disk_key, results, expire=HAZE_CACHE_TTL)
+
+    with _haze_cache_lock:
+        try:
+            haze_cache[key] = results
+        except ValueError:
+            pass  # Caching disabled (HAZE_CACHE_SIZE=0)
+    return results
 
 @app.route('/', methods=['GET', 'POST'])
 def index():
@@ -39,12 +223,12 @@ def index():
                 flash('Please enter some text to process.', 'warning')
                 return redirect(url_for('index'))
             
-            if len(input_text) > 5000:
-                flash('Text too long. Please limit input to 5000 characters.', 'error')
+            if len(input_text) > MAX_INPUT_LENGTH:
+                flash(f'Text too long. Please limit input to {MAX_INPUT_LENGTH} characters.', 'error')
                 return redirect(url_for('index'))
             
             # Validate languages
-            if lang_a not in LANGUAGES or lang_b not in LANGUAGES:
+            if lang_a not in LANGUAGE_KEYS or lang_b not in LANGUAGE_KEYS:
                 flash('Invalid language selection.', 'error')
                 return redirect(url_for('index'))
             
@@ -52,67 +236,96 @@ def index():
                 flash('Please select different source and target languages.', 'warning')
                 return redirect(url_for('index'))
             
-            # Process the text through cross-language phonetic hazing
-            if method == 'hybrid':
-                results = hazer.hybrid_haze(input_text, lang_a, lang_b)
-            else:
-                results = hazer.haze(input_text, lang_a, lang_b, method=method)
+            if method not in METHODS:
+                flash('Invalid method selection.', 'error')
+                return redirect(url_for('index'))
             
-            # Format results for the template
+            # Process the text and format it for the template
+            results = cached_haze(input_text, lang_a, lang_b, method)
             processed_results = format_results_for_template(results, input_text)
             
-            return render_template('index.html', 
-                                 input_text=input_text,
-                                 lang_a=lang_a,
-                                 lang_b=lang_b,
-                                 method=method,
-                                 results=processed_results,
-                                 languages=LANGUAGES)
+            return render_index(lang_a=lang_a,
+                                lang_b=lang_b,
+                                input_text=input_text,
+                                method=method,
+                                results=processed_results)
             
+        except RequestEntityTooLarge:
+            flash(f'Text too long. Please limit input to {MAX_INPUT_LENGTH} characters.', 'error')
+            return redirect(url_for('index'))
         except Exception as e:
-            logging.error(f"Error processing text: {str(e)}")
+            logging.error("Error processing text: %s", e)
             flash(f'An error occurred while processing your text: {str(e)}', 'error')
             return redirect(url_for('index'))
     
-    return render_template('index.html', languages=LANGUAGES)
+    return render_index()
 
-def format_results_for_template(results, input_text):
-    """Format hazer results for the template."""
-    processed_words = []
-    
-    for word_detail in results.get('word_transformations', []):
-        variations = [
-            {
-                'text': word_detail['original'],
-                'similarity': 1.0,
-                'confidence': 'Original'
-            },
-            {
-                'text': word_detail['transformed'],
-                'similarity': 0.8,  # Approximate similarity
-                'confidence': 'High'
-            }
-        ]
-        
-        processed_words.append({
-            'original': word_detail['original'],
-            'variations': variations,
-            'transformation_chain': word_detail.get('chain', '')
-        })
-    
+# Fixed fields of the two variations shown for every word
+ORIGINAL_VARIATION = {'similarity': 1.0, 'confidence': 'Original'}
+TRANSFORMED_VARIATION = {'similarity': 0.8, 'confidence': 'High'}  # Approximate similarity
+
+def format_word(word_detail):
+    """Format a single word transformation for the template."""
+    return {
+        'original': word_detail.original,
+        'variations': [
+            {'text': word_detail.original, **ORIGINAL_VARIATION},
+            {'text': word_detail.transformed, **TRANSFORMED_VARIATION}
+        ],
+        'transformation_chain': word_detail.chain
+    }
+
+def _format_header(results, input_text):
+    """Sentence-level fields of the formatted results."""
     return {
         'original_text': input_text,
         'transformed_text': results.get('transformed_sentence', ''),
         'method': results.get('method', ''),
         'language_route': results.get('language_route', ''),
-        'word_count': results.get('word_count', 0),
+        'word_count': results.get('word_count', 0)
+    }
+
+def _format_summary(word_count):
+    """Summary block of the formatted results."""
+    return {
+        'total_variations': word_count * 2,  # original + transformed
+        'avg_similarity': 0.85
+    }
+
+def format_results_for_template(results, input_text):
+    """Format hazer results for the template."""
+    processed_words = [format_word(word_detail)
+                       for word_detail in results.get('word_transformations', ())]
+    
+    return {
+        **_format_header(results, input_text),
         'processed_words': processed_words,
-        'summary': {
-            'total_variations': len(processed_words) * 2,  # original + transformed
-            'avg_similarity': 0.85
-        }
+        'summary': _format_summary(len(processed_words))
     }
 
+def stream_results_json(results, input_text):
+    """Yield the /api/fuzz JSON body in chunks, one word at a time.
+
+    Produces the same document as jsonify({'results': format_results_for_template(...)})
+    without materializing the formatted word list or the whole body. Used
+    for responses that are not cached; cached ones are serialized whole.
+    """
+    word_transformations = results.get('word_transformations', ())
+    header = orjson.dumps(_format_header(results, input_text))
+    yield b'{"results":{' + header[1:-1] + b',"processed_words":['
+    for i, word_detail in enumerate(word_transformations):
+        yield (b',' if i else b'') + orjson.dumps(format_word(word_detail))
+    yield b'],"summary":' + orjson.dumps(_format_summary(len(word_transformations))) + b'}}'
+
+# Serialized /api/fuzz bodies keyed by (text, lang_a, lang_b, method), so
+# repeated API calls skip formatting and serialization entirely. Bounded by
+# total body size (HAZE_RESPONSE_CACHE_MB, 0 disables it); a maximum-length
+# input serializes to roughly 175 KB.
+RESPONSE_CACHE_BYTES = int(os.environ.get("HAZE_RESPONSE_CACHE_MB", "64")) * 1024 * 1024
+response_cache = LFUCache(maxsize=RESPONSE_CACHE_BYTES, getsizeof=len)
+_response_cache_lock = threading.Lock()
+_response_cache_stats = {'hits': 0, 'misses': 0}
+
 @app.route('/api/fuzz', methods=['POST'])
 def api_fuzz():
     """API endpoint for cross-language phonetic hazing."""
@@ -129,37 +342,86 @@ def api_fuzz():
         if not input_text:
             return jsonify({'error': 'Empty text provided'}), 400
             
-        if len(input_text) > 5000:
-            return jsonify({'error': 'Text too long. Limit: 5000 characters'}), 400
+        if len(input_text) > MAX_INPUT_LENGTH:
+            return jsonify({'error': f'Text too long. Limit: {MAX_INPUT_LENGTH} characters'}), 400
         
         # Validate languages
-        if lang_a not in LANGUAGES or lang_b not in LANGUAGES:
+        if not _is_choice(lang_a, LANGUAGE_KEYS) or not _is_choice(lang_b, LANGUAGE_KEYS):
             return jsonify({'error': 'Invalid language selection'}), 400
             
         if lang_a == lang_b:
             return jsonify({'error': 'Source and target languages must be different'}), 400
         
+        if not _is_choice(method, METHODS):
+            return jsonify({'error': 'Invalid method'}), 400
+        
+        key = (input_text, lang_a, lang_b, method)
+        with _response_cache_lock:
+            body = response_cache.get(key)
+            _response_cache_stats['misses' if body is None else 'hits'] += 1
+        if body is not None:
+            return app.response_class(body, mimetype='application/json')
+        
         # Process the text
-        if method == 'hybrid':
-            results = hazer.hybrid_haze(input_text, lang_a, lang_b)
-        else:
-            results = hazer.haze(input_text, lang_a, lang_b, method=method)
+        results = cached_haze(input_text, lang_a, lang_b, method)
+        if results.get('degraded'):
+            # Not cached, so stream it instead of holding the whole body
+            return app.response_class(stream_results_json(results, input_text),
+                                      mimetype='application/json')
         
-        formatted_results = format_results_for_template(results, input_text)
-        return jsonify({'results': formatted_results})
+        body = orjson.dumps({'results': format_results_for_template(results, input_text)})
+        with _response_cache_lock:
+            try:
+                response_cache[key] = body
+            except ValueError:
+                pass  # Body larger than the cache, or caching disabled
+        return app.response_class(body, mimetype='application/json')
         
+    except RequestEntityTooLarge:
+        return jsonify({'error': f'Text too long. Limit: {MAX_INPUT_LENGTH} characters'}), 413
     except Exception as e:
-        logging.error(f"API error: {str(e)}")
+        logging.error("API error: %s", e)
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/cache_stats', methods=['GET'])
+def api_cache_stats():
+    """API endpoint reporting hazer result and API response cache statistics.
+
+    /api/fuzz requests answered from the response cache never reach the
+    result cache, so they are reported under 'response_cache'.
+    """
+    with _haze_cache_lock:
+        hits, misses = _haze_cache_stats['hits'], _haze_cache_stats['misses']
+        size = haze_cache.currsize
+    with _response_cache_lock:
+        response_hits = _response_cache_stats['hits']
+        response_misses = _response_cache_stats['misses']
+        response_bytes = response_cache.currsize
+    lookups = hits + misses
+    response_lookups = response_hits + response_misses
+    return jsonify({
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': hits / lookups if lookups else 0.0,
+        'size': size,
+        'maxsize': haze_cache.maxsize,
+        'response_cache': {
+            'hits': response_hits,
+            'misses': response_misses,
+            'hit_rate': response_hits / response_lookups if response_lookups else 0.0,
+            'size_bytes': response_bytes,
+            'maxsize_bytes': response_cache.maxsize
+        }
+    })
+
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors."""
-    return render_template('index.html'), 404
+    return render_template(INDEX_TEMPLATE), 404
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors."""
-    logging.error(f"Internal server error: {str(error)}")
+    logging.error("Internal server error: %s", error)
     flash('An internal error occurred. Please try again.', 'error')
-    return render_template('index.html'), 500
+    return render_template(INDEX_TEMPLATE), 500
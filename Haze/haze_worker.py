@@ -0,0 +1,31 @@
+"""Entry points for the hazing process pool.
+
+Pool processes are started fresh instead of forked from a busy request
+worker, so they must not inherit its locks. They import this module, not
+app, and build their own Hazer.
+"""
+
+from phonetic_fuzzer import Hazer
+
+# This process's hazer, created by init_worker
+_hazer = None
+
+
+def init_worker(languages):
+    """Create the pool process's Hazer and load the given word lists."""
+    global _hazer
+    _hazer = Hazer()
+    if languages:
+        _hazer.preload_languages(languages)
+
+
+def run_haze(hazer, input_text, lang_a, lang_b, method):
+    """Run `hazer` on the text with the given method."""
+    if method == "hybrid":
+        return hazer.hybrid_haze(input_text, lang_a, lang_b)
+    return hazer.haze(input_text, lang_a, lang_b, method=method)
+
+
+def pool_haze(input_text, lang_a, lang_b, method):
+    """run_haze with this pool process's hazer."""
+    return run_haze(_hazer, input_text, lang_a, lang_b, method)
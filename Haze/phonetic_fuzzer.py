@@ -7,9 +7,363 @@ Transform between any two languages without English intermediary
 import difflib
 import re
 import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+import numpy as np
+from cachetools import LRUCache
 from anthropic import Anthropic
 from deep_translator import GoogleTranslator
-from typing import List, Tuple, Optional
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    # C++ implementation, much faster than difflib on the matching hot path.
+    # Indel similarity is the normalized insertion/deletion edit distance,
+    # the same measure as RapidFuzz's fuzz.ratio.
+    from rapidfuzz import process
+    from rapidfuzz.distance import Indel
+
+    _ratio = Indel.normalized_similarity
+
+    def _ratios(query: str, choices: List[str]) -> np.ndarray:
+        return process.cdist(
+            [query], choices, scorer=Indel.normalized_similarity, dtype=np.float64
+        )[0]
+
+    def _ratio_matrix(queries: List[str], choices: List[str]) -> np.ndarray:
+        return process.cdist(
+            queries, choices, scorer=Indel.normalized_similarity, dtype=np.float64
+        )
+
+except ImportError:
+
+    def _ratio(a: str, b: str) -> float:
+        # The popularity heuristic is meant for long texts, not short codes
+        return difflib.SequenceMatcher(None, a, b, autojunk=False).ratio()
+
+    def _ratios(query: str, choices: List[str]) -> np.ndarray:
+        return np.fromiter(
+            (_ratio(query, c) for c in choices), dtype=np.float64, count=len(choices)
+        )
+
+    def _ratio_matrix(queries: List[str], choices: List[str]) -> np.ndarray:
+        return np.array([_ratios(q, choices) for q in queries]).reshape(
+            len(queries), len(choices)
+        )
+
+
+# Built-in fallback word lists, read only for the languages actually requested
+_WORDLIST_DIR = Path(__file__).parent / "wordlists"
+
+# Downloaded word lists are cached here so new processes can skip the fetch
+_WORDLIST_CACHE_DIR = (
+    Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "haze"
+)
+_WORDLIST_CACHE_TTL = 30 * 24 * 60 * 60  # seconds
+
+# Soundex digit for each coded letter; every other character is skipped
+_SOUNDEX_CODES = dict(zip("BFPVCGJKQSXZDTLMNR", "111122222222334556"))
+
+
+@dataclass(slots=True)
+class WordDetail:
+    """How a single word of a sentence was transformed."""
+
+    original: str
+    transformed: str
+    chain: str
+    method: str
+    # Only set by hybrid_haze: "translate" or "fuzzy_fallback"
+    fallback_used: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Plain-dict form, as word details were represented before."""
+        detail = {
+            "original": self.original,
+            "transformed": self.transformed,
+            "chain": self.chain,
+            "method": self.method,
+        }
+        if self.fallback_used is not None:
+            detail["fallback_used"] = self.fallback_used
+        return detail
+
+
+class PhoneticIndex(NamedTuple):
+    """Phonetic codes of a word list, stored column-wise for batch scoring."""
+
+    words: Sequence[str]
+    lowered: np.ndarray
+    # Distinct Soundex codes, and the position of each word's code among them
+    soundex_codes: np.ndarray
+    soundex_inverse: np.ndarray
+    metaphone: np.ndarray
+    lengths: np.ndarray
+    # First Soundex letter -> positions of the words whose code starts with it
+    buckets: Dict[str, np.ndarray]
+
+
+# Words scored together per batch; bounds each score matrix to a few MB
+_MATCH_BATCH_SIZE = 32
+
+# Threads used to transform (and so translate) the words of one sentence
+_WORD_WORKERS = 8
+
+# Translator requests in flight at once across all threads of a process, so
+# concurrent requests do not get the process rate-limited by Google
+_MAX_TRANSLATIONS = 8
+_translation_slots = threading.BoundedSemaphore(_MAX_TRANSLATIONS)
+
+# Splits a sentence into (word, "") and ("", separator) tokens, where the
+# separators are the punctuation/whitespace runs between words
+_TOKEN_RE = re.compile(r"(\w+)|(\W+)")
+
+# Clean-ups applied to each rehaze iteration's output, as one single-pass regex
+_REHAZE_MAP = {
+    "yao": "y",
+    "noo": "no",
+    "you": "y",
+    "dee": "de",
+    "aii": "ahí",
+    "maui": "mi",
+    "ai": "a",
+}
+_REHAZE_RE = re.compile(r"\b(" + "|".join(map(re.escape, _REHAZE_MAP)) + r")\b")
+
+# Phonetic codes and pair distances are pure functions of their input, and the
+# same words come up again and again across requests and language pairs.
+_CODE_CACHE_SIZE = 200_000
+
+
+@lru_cache(maxsize=_CODE_CACHE_SIZE)
+def _soundex(word: str) -> str:
+    if not word:
+        return "0000"
+
+    word = word.upper()
+    soundex_code = last = word[0]
+
+    mapping = _SOUNDEX_CODES
+    for char in word[1:]:
+        code = mapping.get(char)
+        if code is not None and code != last:
+            soundex_code += code
+            # Only the first three digits are kept, so stop once they are in
+            if len(soundex_code) == 4:
+                return soundex_code
+            last = code
+
+    return (soundex_code + "000")[:4]
+
+
+@lru_cache(maxsize=_CODE_CACHE_SIZE)
+def _metaphone(word: str) -> str:
+    if not word:
+        return ""
+
+    word = word.upper().replace("PH", "F").replace("GH", "F")
+    word = word.replace("CK", "K").replace("SCH", "SK")
+
+    # The first letter is always kept; after it, vowels are dropped and
+    # repeated letters collapse. Stop as soon as six letters are coded.
+    metaphone = prev_char = word[0]
+    for char in word[1:]:
+        if char != prev_char and char not in "AEIOU":
+            metaphone += char
+            if len(metaphone) == 6:
+                break
+        prev_char = char
+
+    return metaphone
+
+
+def _encode(word: str) -> Tuple[str, str, str]:
+    """Return the (lowercased word, Soundex, Metaphone) codes used for matching."""
+    w = word.lower()
+    return w, _soundex(w), _metaphone(w)
+
+
+def _code_distance(code1: Tuple[str, str, str], code2: Tuple[str, str, str]) -> float:
+    """Calculate phonetic distance between two encoded words.
+
+    Soundex, Metaphone and spelling similarity are all normalized edit-distance
+    scores in [0, 1], weighted 0.4 / 0.4 / 0.2, minus a length penalty.
+    """
+    w1, soundex1, meta1 = code1
+    w2, soundex2, meta2 = code2
+
+    soundex_sim = _ratio(soundex1, soundex2)
+    metaphone_sim = _ratio(meta1, meta2)
+    string_sim = _ratio(w1, w2)
+
+    len_penalty = abs(len(w1) - len(w2)) / max(len(w1), len(w2), 1)
+
+    combined_sim = (
+        soundex_sim * 0.4 + metaphone_sim * 0.4 + string_sim * 0.2
+    ) - len_penalty * 0.1
+
+    return 1 - combined_sim
+
+
+def _combine_scores(
+    soundex_sim: np.ndarray,
+    metaphone_sim: np.ndarray,
+    string_sim: np.ndarray,
+    lengths: np.ndarray,
+    length: int,
+) -> np.ndarray:
+    """Vectorized form of the scoring in _code_distance.
+
+    Works in place on `soundex_sim` and `metaphone_sim` to avoid allocating a
+    temporary array per operation; the order of operations is kept identical
+    so results match _code_distance bit for bit.
+    """
+    len_penalty = np.abs(lengths - length)
+    len_penalty /= np.maximum(lengths, max(length, 1))
+    len_penalty *= 0.1
+
+    combined_sim = soundex_sim
+    combined_sim *= 0.4
+    metaphone_sim *= 0.4
+    combined_sim += metaphone_sim
+    combined_sim += string_sim * 0.2
+    combined_sim -= len_penalty
+
+    return np.subtract(1, combined_sim, out=combined_sim)
+
+
+@lru_cache(maxsize=_CODE_CACHE_SIZE)
+def _pair_distance(w1: str, w2: str) -> float:
+    # Callers pass the pair in sorted order; the distance is symmetric
+    return _code_distance(_encode(w1), _encode(w2))
+
+
+@lru_cache(maxsize=None)
+def _read_builtin_wordlist(language: str) -> Tuple[str, ...]:
+    """Read a built-in word list once per process, shared by every Hazer."""
+    path = _WORDLIST_DIR / f"{language}.txt"
+    if not path.is_file():
+        available = sorted(p.stem for p in _WORDLIST_DIR.glob("*.txt"))
+        raise ValueError(
+            f"Language '{language}' not supported. Available: {available}"
+        )
+
+    # Interned and without repeats; dict.fromkeys keeps the first occurrence
+    lines = path.read_text(encoding="utf-8").splitlines()
+    return tuple(dict.fromkeys(map(sys.intern, lines)))
+
+
+# Language name -> Google Translate language code
+_TRANSLATOR_CODES = {
+    "english": "en",
+    "spanish": "es",
+    "french": "fr",
+    "german": "de",
+    "italian": "it",
+    "portuguese": "pt",
+    "dutch": "nl",
+}
+
+
+# Small built-in dictionary used when the online translator is unavailable,
+# flattened to (from_lang, to_lang, word) -> translation and read-only
+_FALLBACK_TRANSLATIONS = MappingProxyType(
+    {
+        (from_lang, to_lang, word): translation
+        for (from_lang, to_lang), pairs in {
+            ("spanish", "french"): {
+                "casa": "maison",
+                "agua": "eau",
+                "fuego": "feu",
+                "árbol": "arbre",
+                "libro": "livre",
+                "amigo": "ami",
+                "perro": "chien",
+                "gato": "chat",
+                "rojo": "rouge",
+                "azul": "bleu",
+                "verde": "vert",
+                "grande": "grand",
+            },
+            ("french", "spanish"): {
+                "maison": "casa",
+                "eau": "agua",
+                "feu": "fuego",
+                "arbre": "árbol",
+                "livre": "libro",
+                "ami": "amigo",
+                "chien": "perro",
+                "chat": "gato",
+                "rouge": "rojo",
+                "bleu": "azul",
+                "vert": "verde",
+                "grand": "grande",
+            },
+            ("spanish", "italian"): {
+                "casa": "casa",
+                "agua": "acqua",
+                "fuego": "fuoco",
+                "árbol": "albero",
+                "libro": "libro",
+                "amigo": "amico",
+                "perro": "cane",
+                "gato": "gatto",
+                "rojo": "rosso",
+                "azul": "blu",
+                "verde": "verde",
+                "grande": "grande",
+            },
+            ("italian", "spanish"): {
+                "casa": "casa",
+                "acqua": "agua",
+                "fuoco": "fuego",
+                "albero": "árbol",
+                "libro": "libro",
+                "amico": "amigo",
+                "cane": "perro",
+                "gatto": "gato",
+                "rosso": "rojo",
+                "blu": "azul",
+                "verde": "verde",
+                "grande": "grande",
+            },
+            ("german", "french"): {
+                "haus": "maison",
+                "wasser": "eau",
+                "feuer": "feu",
+                "baum": "arbre",
+                "buch": "livre",
+                "freund": "ami",
+                "hund": "chien",
+                "katze": "chat",
+                "rot": "rouge",
+                "blau": "bleu",
+                "grün": "vert",
+                "groß": "grand",
+            },
+            ("french", "german"): {
+                "maison": "haus",
+                "eau": "wasser",
+                "feu": "feuer",
+                "arbre": "baum",
+                "livre": "buch",
+                "ami": "freund",
+                "chien": "hund",
+                "chat": "katze",
+                "rouge": "rot",
+                "bleu": "blau",
+                "vert": "grün",
+                "grand": "groß",
+            },
+        }.items()
+        for word, translation in pairs.items()
+    }
+)
 
 
 # Get API key from environment variable
@@ -26,107 +380,205 @@ def get_api_key():
 class Hazer:
     def __init__(self):
         self.word_lists = {}
+        # language -> PhoneticIndex of its word list
+        self._phonetic_index = {}
+        # Shared by the word-list downloaders so connections are reused
+        self._session = None
+        self._load_locks = {}
+        self._locks_lock = threading.Lock()
+        # Created on first use so its connection pool is reused across calls
+        self._anthropic: Optional[Anthropic] = None
+        self._anthropic_lock = threading.Lock()
+        self.clear_caches()
+
+    def clear_caches(self) -> None:
+        """Forget memoized matches and translations, e.g. after changing a list."""
+        # (lowercased word, language) -> best fuzzy match in that language
+        self._match_cache = LRUCache(maxsize=100_000)
+        self._match_lock = threading.Lock()
+        # (word, from_lang, to_lang) -> translation
+        self._translation_cache = LRUCache(maxsize=50_000)
+        self._translation_lock = threading.Lock()
+        # (text, lang_a) -> generate_final_text response
+        self._final_text_cache = LRUCache(maxsize=10_000)
+        self._final_text_lock = threading.Lock()
 
     def soundex(self, word: str) -> str:
         """Generate Soundex code for phonetic similarity."""
-        if not word:
-            return "0000"
-
-        word = word.upper()
-        soundex_code = word[0]
-
-        mapping = {
-            "B": "1",
-            "F": "1",
-            "P": "1",
-            "V": "1",
-            "C": "2",
-            "G": "2",
-            "J": "2",
-            "K": "2",
-            "Q": "2",
-            "S": "2",
-            "X": "2",
-            "Z": "2",
-            "D": "3",
-            "T": "3",
-            "L": "4",
-            "M": "5",
-            "N": "5",
-            "R": "6",
-        }
-
-        for char in word[1:]:
-            if char in mapping:
-                code = mapping[char]
-                if code != soundex_code[-1]:
-                    soundex_code += code
-
-        soundex_code = (soundex_code + "0000")[:4]
-        return soundex_code
+        return _soundex(word)
 
     def metaphone_simple(self, word: str) -> str:
         """Simplified Metaphone algorithm."""
-        if not word:
-            return ""
-
-        word = word.upper().replace("PH", "F").replace("GH", "F")
-        word = word.replace("CK", "K").replace("SCH", "SK")
-
-        metaphone = ""
-        prev_char = ""
-
-        for char in word:
-            if char in "AEIOU":
-                if not metaphone:
-                    metaphone += char
-            elif char != prev_char:
-                metaphone += char
-            prev_char = char
-
-        return metaphone[:6]
+        return _metaphone(word)
 
     def phonetic_distance(self, word1: str, word2: str) -> float:
         """Calculate phonetic distance between two words."""
         w1, w2 = word1.lower(), word2.lower()
+        if w1 == w2:
+            return 0.0
+        if not w1 or not w2:
+            return 1.0
+        return _pair_distance(w1, w2) if w1 < w2 else _pair_distance(w2, w1)
+
+    def build_phonetic_index(self, word_list: List[str]) -> PhoneticIndex:
+        """Precompute the phonetic codes of every word in a word list."""
+        lowered, soundex, metaphone = [], [], []
+        for word in word_list:
+            w, s, m = _encode(word)
+            lowered.append(w)
+            soundex.append(s)
+            metaphone.append(m)
+        lengths = np.fromiter(map(len, lowered), dtype=np.float64, count=len(lowered))
+
+        buckets = {}
+        for position, code in enumerate(soundex):
+            buckets.setdefault(code[0], []).append(position)
+
+        # Soundex codes repeat heavily (a few thousand distinct codes for tens
+        # of thousands of words), so each distinct code is only scored once
+        soundex_codes, soundex_inverse = np.unique(
+            np.array(soundex, dtype=object), return_inverse=True
+        )
 
-        soundex1, soundex2 = self.soundex(w1), self.soundex(w2)
-        soundex_sim = difflib.SequenceMatcher(None, soundex1, soundex2).ratio()
-
-        meta1, meta2 = self.metaphone_simple(w1), self.metaphone_simple(w2)
-        metaphone_sim = difflib.SequenceMatcher(None, meta1, meta2).ratio()
-
-        string_sim = difflib.SequenceMatcher(None, w1, w2).ratio()
+        return PhoneticIndex(
+            word_list,
+            np.array(lowered, dtype=object),
+            soundex_codes,
+            soundex_inverse.reshape(-1),
+            np.array(metaphone, dtype=object),
+            lengths,
+            {letter: np.array(p, dtype=np.intp) for letter, p in buckets.items()},
+        )
 
-        len_penalty = abs(len(w1) - len(w2)) / max(len(w1), len(w2), 1)
+    def phonetic_distances(
+        self,
+        word: str,
+        index: PhoneticIndex,
+        exclude_identical: bool = False,
+        candidates: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Calculate the phonetic distance from a word to every word of an index.
+
+        Vectorized equivalent of calling phonetic_distance against each word.
+        With `exclude_identical`, words equal to `word` get an infinite distance.
+        `candidates` restricts scoring to those positions of the index.
+        """
+        w, soundex, meta = _encode(word)
+
+        if candidates is None:
+            soundex_inverse, metaphones, lowered = (
+                index.soundex_inverse, index.metaphone, index.lowered
+            )
+            lengths = index.lengths
+        else:
+            soundex_inverse = index.soundex_inverse[candidates]
+            metaphones = index.metaphone[candidates]
+            lowered = index.lowered[candidates]
+            lengths = index.lengths[candidates]
 
-        combined_sim = (
-            soundex_sim * 0.4 + metaphone_sim * 0.4 + string_sim * 0.2
-        ) - len_penalty * 0.1
+        soundex_sim = _ratios(soundex, index.soundex_codes)[soundex_inverse]
+        metaphone_sim = _ratios(meta, metaphones)
+        string_sim = _ratios(w, lowered)
 
-        return 1 - combined_sim
+        distances = _combine_scores(
+            soundex_sim, metaphone_sim, string_sim, lengths, len(w)
+        )
+        if exclude_identical:
+            # A string similarity of exactly 1.0 only occurs for identical words
+            distances[string_sim == 1.0] = np.inf
+        return distances
 
-    def load_word_list(self, language: str) -> List[str]:
+    def load_word_list(self, language: str) -> Sequence[str]:
         """Load word list for the specified language."""
         if language in self.word_lists:
             return self.word_lists[language]
 
-        words = self._try_frequency_lists(language)
+        # One lock per language: concurrent callers wait for a single download
+        # of the same list, while different languages still load in parallel
+        with self._locks_lock:
+            lock = self._load_locks.setdefault(language, threading.Lock())
+
+        with lock:
+            if language not in self.word_lists:
+                self.word_lists[language] = self._fetch_word_list(language)
+            return self.word_lists[language]
+
+    def _fetch_word_list(self, language: str) -> Sequence[str]:
+        """Get a word list from the disk cache, the network, or the built-in lists."""
+        words = self._read_cached_wordlist(language)
         if words:
-            self.word_lists[language] = words
             return words
 
-        words = self._try_online_wordlist(language)
+        words = self._try_frequency_lists(language)
+        if not words:
+            words = self._try_online_wordlist(language)
         if words:
-            self.word_lists[language] = words
+            self._write_cached_wordlist(language, words)
             return words
 
         return self._get_builtin_wordlist(language)
 
+    def preload_languages(self, languages: List[str]) -> None:
+        """Load several word lists and their phonetic indexes at once.
+
+        The downloads are independent network I/O, so they run in parallel.
+        """
+        languages = list(languages)
+        if not languages:
+            return
+        with ThreadPoolExecutor(max_workers=len(languages)) as executor:
+            list(executor.map(self._encoded_word_list, languages))
+
+    def _encoded_word_list(self, language: str) -> Tuple[Sequence[str], PhoneticIndex]:
+        """Load a word list along with the precomputed phonetic codes of its words."""
+        words = self.load_word_list(language)
+        index = self._phonetic_index.get(language)
+        if index is None or index.words is not words:
+            index = self.build_phonetic_index(words)
+            self._phonetic_index[language] = index
+        return words, index
+
+    def _read_cached_wordlist(self, language: str) -> List[str]:
+        """Return a previously downloaded word list, or [] if missing or stale."""
+        path = _WORDLIST_CACHE_DIR / f"{language.lower()}.txt"
+        try:
+            if time.time() - path.stat().st_mtime > _WORDLIST_CACHE_TTL:
+                return []
+            return [
+                sys.intern(word)
+                for word in path.read_text(encoding="utf-8").splitlines()
+            ]
+        except OSError:
+            return []
+
+    def _write_cached_wordlist(self, language: str, words: List[str]) -> None:
+        """Save a downloaded word list to the on-disk cache, if it is writable."""
+        path = _WORDLIST_CACHE_DIR / f"{language.lower()}.txt"
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text("\n".join(words), encoding="utf-8")
+            # Atomic, so concurrent workers never read a half-written list
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def _http_session(self):
+        """Return the requests session used for word-list downloads."""
+        # Locked: preload_languages downloads several lists at once
+        with self._locks_lock:
+            if self._session is None:
+                import requests
+
+                # Sends Accept-Encoding: gzip, deflate by default, and keeps
+                # connections to raw.githubusercontent.com alive between lists
+                self._session = requests.Session()
+            return self._session
+
     def _try_frequency_lists(self, language: str) -> List[str]:
         """Load most common words from frequency lists."""
         try:
-            import requests
+            session = self._http_session()
 
             freq_urls = {
                 "english": "https://raw.githubusercontent.com/first20hours/google-10000-english/master/google-10000-english-no-swears.txt",
@@ -139,18 +591,26 @@ class Hazer:
             }
 
             if language.lower() in freq_urls:
-                response = requests.get(freq_urls[language.lower()], timeout=10)
-                response.raise_for_status()
-
-                lines = response.text.strip().split("\n")
-                words = []
-
-                for line in lines:
-                    parts = line.split()
-                    if parts:
-                        word = parts[0].strip().lower()
-                        if 1 <= len(word) <= 25 and word.isalpha():
-                            words.append(word)
+                # Stream the body line by line rather than decoding and
+                # splitting the whole multi-megabyte file at once
+                with session.get(
+                    freq_urls[language.lower()], stream=True, timeout=10
+                ) as response:
+                    response.raise_for_status()
+                    response.encoding = response.encoding or "utf-8"
+
+                    words, seen = [], set()
+                    for line in response.iter_lines(decode_unicode=True):
+                        parts = line.split()
+                        if parts:
+                            word = parts[0].lower()
+                            if 1 <= len(word) <= 25 and word.isalpha():
+                                # Drop repeats and share one copy of each word
+                                # with the other lists and caches that hold it
+                                word = sys.intern(word)
+                                if word not in seen:
+                                    seen.add(word)
+                                    words.append(word)
 
                 return words
 
@@ -162,7 +622,7 @@ class Hazer:
     def _try_online_wordlist(self, language: str) -> List[str]:
         """Download word lists from online sources."""
         try:
-            import requests
+            session = self._http_session()
 
             urls = {
                 "english": "https://raw.githubusercontent.com/dwyl/english-words/master/words_alpha.txt",
@@ -174,15 +634,20 @@ class Hazer:
             }
 
             if language.lower() in urls:
-                response = requests.get(urls[language.lower()], timeout=20)
-                response.raise_for_status()
-
-                words = response.text.strip().split("\n")
-                filtered = [
-                    w.strip().lower()
-                    for w in words
-                    if w.strip() and 1 <= len(w.strip()) <= 25 and w.strip().isalpha()
-                ]
+                with session.get(
+                    urls[language.lower()], stream=True, timeout=20
+                ) as response:
+                    response.raise_for_status()
+                    response.encoding = response.encoding or "utf-8"
+
+                    filtered, seen = [], set()
+                    for line in response.iter_lines(decode_unicode=True):
+                        word = line.strip()
+                        if 1 <= len(word) <= 25 and word.isalpha():
+                            word = sys.intern(word.lower())
+                            if word not in seen:
+                                seen.add(word)
+                                filtered.append(word)
 
                 return filtered
 
@@ -191,1410 +656,206 @@ class Hazer:
 
         return []
 
-    def _get_builtin_wordlist(self, language: str) -> List[str]:
-        """Fallback to built-in word lists."""
-
-        sample_words = {
-            "english": [
-                "hello",
-                "world",
-                "computer",
-                "language",
-                "phone",
-                "house",
-                "water",
-                "fire",
-                "tree",
-                "mountain",
-                "river",
-                "ocean",
-                "sky",
-                "sun",
-                "moon",
-                "star",
-                "book",
-                "pen",
-                "paper",
-                "table",
-                "chair",
-                "window",
-                "door",
-                "car",
-                "bicycle",
-                "airplane",
-                "train",
-                "ship",
-                "bridge",
-                "road",
-                "city",
-                "town",
-                "friend",
-                "family",
-                "mother",
-                "father",
-                "brother",
-                "sister",
-                "child",
-                "baby",
-                "dog",
-                "cat",
-                "bird",
-                "fish",
-                "horse",
-                "cow",
-                "sheep",
-                "chicken",
-                "apple",
-                "orange",
-                "banana",
-                "grape",
-                "strawberry",
-                "bread",
-                "milk",
-                "cheese",
-                "head",
-                "eye",
-                "nose",
-                "mouth",
-                "ear",
-                "hand",
-                "foot",
-                "arm",
-                "leg",
-                "finger",
-                "heart",
-                "brain",
-                "stomach",
-                "back",
-                "shoulder",
-                "knee",
-                "elbow",
-                "neck",
-                "red",
-                "blue",
-                "green",
-                "yellow",
-                "black",
-                "white",
-                "purple",
-                "orange",
-                "pink",
-                "brown",
-                "gray",
-                "silver",
-                "gold",
-                "violet",
-                "turquoise",
-                "crimson",
-                "one",
-                "two",
-                "three",
-                "four",
-                "five",
-                "six",
-                "seven",
-                "eight",
-                "nine",
-                "ten",
-                "potato",
-                "tomato",
-                "carrot",
-                "onion",
-                "garlic",
-                "pepper",
-                "salt",
-                "sugar",
-                "coffee",
-                "tea",
-                "beer",
-                "wine",
-                "juice",
-                "soda",
-                "chocolate",
-                "cake",
-                "pizza",
-                "hamburger",
-                "sandwich",
-                "soup",
-                "salad",
-                "rice",
-                "pasta",
-                "meat",
-                "rain",
-                "snow",
-                "wind",
-                "storm",
-                "cloud",
-                "sunshine",
-                "thunder",
-                "lightning",
-                "hot",
-                "cold",
-                "warm",
-                "cool",
-                "wet",
-                "dry",
-                "humid",
-                "freezing",
-                "forest",
-                "desert",
-                "beach",
-                "island",
-                "valley",
-                "hill",
-                "lake",
-                "pond",
-                "flower",
-                "grass",
-                "leaf",
-                "branch",
-                "root",
-                "seed",
-                "garden",
-                "park",
-                "internet",
-                "email",
-                "website",
-                "software",
-                "hardware",
-                "keyboard",
-                "mouse",
-                "screen",
-                "smartphone",
-                "tablet",
-                "laptop",
-                "desktop",
-                "printer",
-                "camera",
-                "video",
-                "photo",
-                "happy",
-                "sad",
-                "angry",
-                "excited",
-                "nervous",
-                "calm",
-                "peaceful",
-                "stressed",
-                "beautiful",
-                "ugly",
-                "smart",
-                "stupid",
-                "funny",
-                "serious",
-                "kind",
-                "mean",
-                "big",
-                "small",
-                "tall",
-                "short",
-                "fat",
-                "thin",
-                "old",
-                "young",
-                "new",
-                "ancient",
-                "fast",
-                "slow",
-                "strong",
-                "weak",
-                "rich",
-                "poor",
-                "expensive",
-                "cheap",
-                "run",
-                "walk",
-                "jump",
-                "swim",
-                "fly",
-                "drive",
-                "ride",
-                "climb",
-                "fall",
-                "stand",
-                "sit",
-                "sleep",
-                "wake",
-                "eat",
-                "drink",
-                "cook",
-                "clean",
-                "wash",
-                "build",
-                "break",
-                "read",
-                "write",
-                "speak",
-                "listen",
-                "see",
-                "hear",
-                "touch",
-                "smell",
-                "taste",
-                "love",
-                "hate",
-                "like",
-                "want",
-                "need",
-                "have",
-                "give",
-                "take",
-                "buy",
-                "sell",
-            ],
-            "spanish": [
-                "hola",
-                "mundo",
-                "computadora",
-                "idioma",
-                "teléfono",
-                "casa",
-                "agua",
-                "fuego",
-                "árbol",
-                "montaña",
-                "río",
-                "océano",
-                "cielo",
-                "sol",
-                "luna",
-                "estrella",
-                "libro",
-                "pluma",
-                "papel",
-                "mesa",
-                "silla",
-                "ventana",
-                "puerta",
-                "coche",
-                "bicicleta",
-                "avión",
-                "tren",
-                "barco",
-                "puente",
-                "carretera",
-                "ciudad",
-                "pueblo",
-                "amigo",
-                "familia",
-                "madre",
-                "padre",
-                "hermano",
-                "hermana",
-                "niño",
-                "bebé",
-                "perro",
-                "gato",
-                "pájaro",
-                "pez",
-                "caballo",
-                "vaca",
-                "oveja",
-                "pollo",
-                "manzana",
-                "naranja",
-                "plátano",
-                "uva",
-                "fresa",
-                "pan",
-                "leche",
-                "queso",
-                "cabeza",
-                "ojo",
-                "nariz",
-                "boca",
-                "oreja",
-                "mano",
-                "pie",
-                "brazo",
-                "pierna",
-                "dedo",
-                "corazón",
-                "cerebro",
-                "estómago",
-                "espalda",
-                "hombro",
-                "rodilla",
-                "codo",
-                "cuello",
-                "rojo",
-                "azul",
-                "verde",
-                "amarillo",
-                "negro",
-                "blanco",
-                "morado",
-                "naranja",
-                "rosa",
-                "marrón",
-                "gris",
-                "plata",
-                "oro",
-                "violeta",
-                "turquesa",
-                "carmesí",
-                "uno",
-                "dos",
-                "tres",
-                "cuatro",
-                "cinco",
-                "seis",
-                "siete",
-                "ocho",
-                "nueve",
-                "diez",
-                "papa",
-                "tomate",
-                "zanahoria",
-                "cebolla",
-                "ajo",
-                "pimienta",
-                "sal",
-                "azúcar",
-                "café",
-                "té",
-                "cerveza",
-                "vino",
-                "jugo",
-                "refresco",
-                "chocolate",
-                "pastel",
-                "pizza",
-                "hamburguesa",
-                "sándwich",
-                "sopa",
-                "ensalada",
-                "arroz",
-                "pasta",
-                "carne",
-                "lluvia",
-                "nieve",
-                "viento",
-                "tormenta",
-                "nube",
-                "sol",
-                "trueno",
-                "rayo",
-                "caliente",
-                "frío",
-                "tibio",
-                "fresco",
-                "mojado",
-                "seco",
-                "húmedo",
-                "helado",
-                "bosque",
-                "desierto",
-                "playa",
-                "isla",
-                "valle",
-                "colina",
-                "lago",
-                "estanque",
-                "flor",
-                "hierba",
-                "hoja",
-                "rama",
-                "raíz",
-                "semilla",
-                "jardín",
-                "parque",
-                "feliz",
-                "triste",
-                "enojado",
-                "emocionado",
-                "nervioso",
-                "tranquilo",
-                "pacífico",
-                "estresado",
-                "hermoso",
-                "feo",
-                "inteligente",
-                "tonto",
-                "divertido",
-                "serio",
-                "amable",
-                "malo",
-                "grande",
-                "pequeño",
-                "alto",
-                "bajo",
-                "gordo",
-                "delgado",
-                "viejo",
-                "joven",
-                "nuevo",
-                "antiguo",
-                "rápido",
-                "lento",
-                "fuerte",
-                "débil",
-                "rico",
-                "pobre",
-                "caro",
-                "barato",
-                "correr",
-                "caminar",
-                "saltar",
-                "nadar",
-                "volar",
-                "conducir",
-                "montar",
-                "subir",
-                "caer",
-                "estar",
-                "amar",
-                "odiar",
-                "gustar",
-                "querer",
-                "necesitar",
-                "tener",
-                "dar",
-                "tomar",
-                "comprar",
-                "vender",
-            ],
-            "french": [
-                "bonjour",
-                "monde",
-                "ordinateur",
-                "langue",
-                "téléphone",
-                "maison",
-                "eau",
-                "feu",
-                "arbre",
-                "montagne",
-                "rivière",
-                "océan",
-                "ciel",
-                "soleil",
-                "lune",
-                "étoile",
-                "livre",
-                "stylo",
-                "papier",
-                "table",
-                "chaise",
-                "fenêtre",
-                "porte",
-                "voiture",
-                "bicyclette",
-                "avion",
-                "train",
-                "bateau",
-                "pont",
-                "route",
-                "ville",
-                "village",
-                "ami",
-                "famille",
-                "mère",
-                "père",
-                "frère",
-                "sœur",
-                "enfant",
-                "bébé",
-                "chien",
-                "chat",
-                "oiseau",
-                "poisson",
-                "cheval",
-                "vache",
-                "mouton",
-                "poulet",
-                "pomme",
-                "orange",
-                "banane",
-                "raisin",
-                "fraise",
-                "pain",
-                "lait",
-                "fromage",
-                "tête",
-                "œil",
-                "nez",
-                "bouche",
-                "oreille",
-                "main",
-                "pied",
-                "bras",
-                "jambe",
-                "doigt",
-                "cœur",
-                "cerveau",
-                "estomac",
-                "dos",
-                "épaule",
-                "genou",
-                "coude",
-                "cou",
-                "rouge",
-                "bleu",
-                "vert",
-                "jaune",
-                "noir",
-                "blanc",
-                "violet",
-                "orange",
-                "rose",
-                "brun",
-                "gris",
-                "argent",
-                "or",
-                "violette",
-                "turquoise",
-                "cramoisi",
-                "un",
-                "deux",
-                "trois",
-                "quatre",
-                "cinq",
-                "six",
-                "sept",
-                "huit",
-                "neuf",
-                "dix",
-                "café",
-                "thé",
-                "bière",
-                "vin",
-                "jus",
-                "soda",
-                "chocolat",
-                "gâteau",
-                "pizza",
-                "hamburger",
-                "sandwich",
-                "soupe",
-                "salade",
-                "riz",
-                "pâtes",
-                "viande",
-                "pluie",
-                "neige",
-                "vent",
-                "orage",
-                "nuage",
-                "soleil",
-                "tonnerre",
-                "éclair",
-                "chaud",
-                "froid",
-                "tiède",
-                "frais",
-                "mouillé",
-                "sec",
-                "humide",
-                "gelé",
-                "forêt",
-                "désert",
-                "plage",
-                "île",
-                "vallée",
-                "colline",
-                "lac",
-                "étang",
-                "fleur",
-                "herbe",
-                "feuille",
-                "branche",
-                "racine",
-                "graine",
-                "jardin",
-                "parc",
-                "heureux",
-                "triste",
-                "fâché",
-                "excité",
-                "nerveux",
-                "calme",
-                "paisible",
-                "stressé",
-                "beau",
-                "laid",
-                "intelligent",
-                "stupide",
-                "drôle",
-                "sérieux",
-                "gentil",
-                "méchant",
-                "grand",
-                "petit",
-                "haut",
-                "court",
-                "gros",
-                "mince",
-                "vieux",
-                "jeune",
-                "nouveau",
-                "ancien",
-                "rapide",
-                "lent",
-                "fort",
-                "faible",
-                "riche",
-                "pauvre",
-                "cher",
-                "bon marché",
-                "courir",
-                "marcher",
-                "sauter",
-                "nager",
-                "voler",
-                "conduire",
-                "monter",
-                "grimper",
-                "tomber",
-                "aimer",
-                "détester",
-                "aimer",
-                "vouloir",
-                "avoir besoin",
-                "avoir",
-                "donner",
-                "prendre",
-                "acheter",
-                "vendre",
-            ],
-            "german": [
-                "hallo",
-                "welt",
-                "computer",
-                "sprache",
-                "telefon",
-                "haus",
-                "wasser",
-                "feuer",
-                "baum",
-                "berg",
-                "fluss",
-                "ozean",
-                "himmel",
-                "sonne",
-                "mond",
-                "stern",
-                "buch",
-                "stift",
-                "papier",
-                "tisch",
-                "stuhl",
-                "fenster",
-                "tür",
-                "auto",
-                "fahrrad",
-                "flugzeug",
-                "zug",
-                "schiff",
-                "brücke",
-                "straße",
-                "stadt",
-                "dorf",
-                "freund",
-                "familie",
-                "mutter",
-                "vater",
-                "bruder",
-                "schwester",
-                "kind",
-                "baby",
-                "hund",
-                "katze",
-                "vogel",
-                "fisch",
-                "pferd",
-                "kuh",
-                "schaf",
-                "huhn",
-                "apfel",
-                "orange",
-                "banane",
-                "traube",
-                "erdbeere",
-                "brot",
-                "milch",
-                "käse",
-                "kopf",
-                "auge",
-                "nase",
-                "mund",
-                "ohr",
-                "hand",
-                "fuß",
-                "arm",
-                "bein",
-                "finger",
-                "herz",
-                "gehirn",
-                "magen",
-                "rücken",
-                "schulter",
-                "knie",
-                "ellbogen",
-                "hals",
-                "rot",
-                "blau",
-                "grün",
-                "gelb",
-                "schwarz",
-                "weiß",
-                "lila",
-                "orange",
-                "rosa",
-                "braun",
-                "grau",
-                "silber",
-                "gold",
-                "violett",
-                "türkis",
-                "karmesin",
-                "eins",
-                "zwei",
-                "drei",
-                "vier",
-                "fünf",
-                "sechs",
-                "sieben",
-                "acht",
-                "neun",
-                "zehn",
-                "kaffee",
-                "tee",
-                "bier",
-                "wein",
-                "saft",
-                "limonade",
-                "schokolade",
-                "kuchen",
-                "regen",
-                "schnee",
-                "wind",
-                "sturm",
-                "wolke",
-                "sonnenschein",
-                "donner",
-                "blitz",
-                "heiß",
-                "kalt",
-                "warm",
-                "kühl",
-                "nass",
-                "trocken",
-                "feucht",
-                "gefroren",
-                "wald",
-                "wüste",
-                "strand",
-                "insel",
-                "tal",
-                "hügel",
-                "see",
-                "teich",
-                "blume",
-                "gras",
-                "blatt",
-                "ast",
-                "wurzel",
-                "samen",
-                "garten",
-                "park",
-                "glücklich",
-                "traurig",
-                "wütend",
-                "aufgeregt",
-                "nervös",
-                "ruhig",
-                "friedlich",
-                "gestresst",
-                "schön",
-                "hässlich",
-                "klug",
-                "dumm",
-                "lustig",
-                "ernst",
-                "freundlich",
-                "gemein",
-                "groß",
-                "klein",
-                "hoch",
-                "kurz",
-                "dick",
-                "dünn",
-                "alt",
-                "jung",
-                "neu",
-                "alt",
-                "schnell",
-                "langsam",
-                "stark",
-                "schwach",
-                "reich",
-                "arm",
-                "teuer",
-                "billig",
-                "laufen",
-                "gehen",
-                "springen",
-                "schwimmen",
-                "fliegen",
-                "fahren",
-                "reiten",
-                "klettern",
-                "lieben",
-                "hassen",
-                "mögen",
-                "wollen",
-                "brauchen",
-                "haben",
-                "geben",
-                "nehmen",
-                "kaufen",
-                "verkaufen",
-            ],
-            "italian": [
-                "ciao",
-                "mondo",
-                "computer",
-                "lingua",
-                "telefono",
-                "casa",
-                "acqua",
-                "fuoco",
-                "albero",
-                "montagna",
-                "fiume",
-                "oceano",
-                "cielo",
-                "sole",
-                "luna",
-                "stella",
-                "libro",
-                "penna",
-                "carta",
-                "tavolo",
-                "sedia",
-                "finestra",
-                "porta",
-                "macchina",
-                "bicicletta",
-                "aereo",
-                "treno",
-                "nave",
-                "ponte",
-                "strada",
-                "città",
-                "paese",
-                "amico",
-                "famiglia",
-                "madre",
-                "padre",
-                "fratello",
-                "sorella",
-                "bambino",
-                "neonato",
-                "cane",
-                "gatto",
-                "uccello",
-                "pesce",
-                "cavallo",
-                "mucca",
-                "pecora",
-                "pollo",
-                "mela",
-                "arancia",
-                "banana",
-                "uva",
-                "fragola",
-                "pane",
-                "latte",
-                "formaggio",
-                "testa",
-                "occhio",
-                "naso",
-                "bocca",
-                "orecchio",
-                "mano",
-                "piede",
-                "braccio",
-                "gamba",
-                "dito",
-                "cuore",
-                "cervello",
-                "stomaco",
-                "schiena",
-                "spalla",
-                "ginocchio",
-                "gomito",
-                "collo",
-                "rosso",
-                "blu",
-                "verde",
-                "giallo",
-                "nero",
-                "bianco",
-                "viola",
-                "arancione",
-                "rosa",
-                "marrone",
-                "grigio",
-                "argento",
-                "oro",
-                "violetto",
-                "turchese",
-                "cremisi",
-                "uno",
-                "due",
-                "tre",
-                "quattro",
-                "cinque",
-                "sei",
-                "sette",
-                "otto",
-                "nove",
-                "dieci",
-                "caffè",
-                "tè",
-                "birra",
-                "vino",
-                "succo",
-                "soda",
-                "cioccolato",
-                "torta",
-                "pioggia",
-                "neve",
-                "vento",
-                "tempesta",
-                "nuvola",
-                "sole",
-                "tuono",
-                "fulmine",
-                "caldo",
-                "freddo",
-                "tiepido",
-                "fresco",
-                "bagnato",
-                "secco",
-                "umido",
-                "gelato",
-                "foresta",
-                "deserto",
-                "spiaggia",
-                "isola",
-                "valle",
-                "collina",
-                "lago",
-                "stagno",
-                "fiore",
-                "erba",
-                "foglia",
-                "ramo",
-                "radice",
-                "seme",
-                "giardino",
-                "parco",
-                "felice",
-                "triste",
-                "arrabbiato",
-                "eccitato",
-                "nervoso",
-                "calmo",
-                "pacifico",
-                "stressato",
-                "bello",
-                "brutto",
-                "intelligente",
-                "stupido",
-                "divertente",
-                "serio",
-                "gentile",
-                "cattivo",
-                "grande",
-                "piccolo",
-                "alto",
-                "basso",
-                "grasso",
-                "magro",
-                "vecchio",
-                "giovane",
-                "nuovo",
-                "antico",
-                "veloce",
-                "lento",
-                "forte",
-                "debole",
-                "ricco",
-                "povero",
-                "costoso",
-                "economico",
-                "correre",
-                "camminare",
-                "saltare",
-                "nuotare",
-                "volare",
-                "guidare",
-                "cavalcare",
-                "arrampicare",
-                "amare",
-                "odiare",
-                "piacere",
-                "volere",
-                "aver bisogno",
-                "avere",
-                "dare",
-                "prendere",
-                "comprare",
-                "vendere",
-            ],
-            "portuguese": [
-                "olá",
-                "mundo",
-                "computador",
-                "idioma",
-                "telefone",
-                "casa",
-                "água",
-                "fogo",
-                "árvore",
-                "montanha",
-                "rio",
-                "oceano",
-                "céu",
-                "sol",
-                "lua",
-                "estrela",
-                "livro",
-                "caneta",
-                "papel",
-                "mesa",
-                "cadeira",
-                "janela",
-                "porta",
-                "carro",
-                "bicicleta",
-                "avião",
-                "trem",
-                "navio",
-                "ponte",
-                "estrada",
-                "cidade",
-                "vila",
-                "amigo",
-                "família",
-                "mãe",
-                "pai",
-                "irmão",
-                "irmã",
-                "criança",
-                "bebê",
-                "cachorro",
-                "gato",
-                "pássaro",
-                "peixe",
-                "cavalo",
-                "vaca",
-                "ovelha",
-                "galinha",
-                "maçã",
-                "laranja",
-                "banana",
-                "uva",
-                "morango",
-                "pão",
-                "leite",
-                "queijo",
-                "cabeça",
-                "olho",
-                "nariz",
-                "boca",
-                "orelha",
-                "mão",
-                "pé",
-                "braço",
-                "perna",
-                "dedo",
-                "coração",
-                "cérebro",
-                "estômago",
-                "costas",
-                "ombro",
-                "joelho",
-                "cotovelo",
-                "pescoço",
-                "vermelho",
-                "azul",
-                "verde",
-                "amarelo",
-                "preto",
-                "branco",
-                "roxo",
-                "laranja",
-                "rosa",
-                "marrom",
-                "cinza",
-                "prata",
-                "ouro",
-                "violeta",
-                "turquesa",
-                "carmesim",
-                "um",
-                "dois",
-                "três",
-                "quatro",
-                "cinco",
-                "seis",
-                "sete",
-                "oito",
-                "nove",
-                "dez",
-                "café",
-                "chá",
-                "cerveja",
-                "vinho",
-                "suco",
-                "refrigerante",
-                "chocolate",
-                "bolo",
-                "chuva",
-                "neve",
-                "vento",
-                "tempestade",
-                "nuvem",
-                "sol",
-                "trovão",
-                "relâmpago",
-                "quente",
-                "frio",
-                "morno",
-                "fresco",
-                "molhado",
-                "seco",
-                "úmido",
-                "congelado",
-                "floresta",
-                "deserto",
-                "praia",
-                "ilha",
-                "vale",
-                "colina",
-                "lago",
-                "lagoa",
-                "flor",
-                "grama",
-                "folha",
-                "galho",
-                "raiz",
-                "semente",
-                "jardim",
-                "parque",
-                "feliz",
-                "triste",
-                "bravo",
-                "animado",
-                "nervoso",
-                "calmo",
-                "pacífico",
-                "estressado",
-                "bonito",
-                "feio",
-                "inteligente",
-                "estúpido",
-                "engraçado",
-                "sério",
-                "gentil",
-                "mau",
-                "grande",
-                "pequeno",
-                "alto",
-                "baixo",
-                "gordo",
-                "magro",
-                "velho",
-                "jovem",
-                "novo",
-                "antigo",
-                "rápido",
-                "lento",
-                "forte",
-                "fraco",
-                "rico",
-                "pobre",
-                "caro",
-                "barato",
-                "correr",
-                "andar",
-                "pular",
-                "nadar",
-                "voar",
-                "dirigir",
-                "andar",
-                "escalar",
-                "amar",
-                "odiar",
-                "gostar",
-                "querer",
-                "precisar",
-                "ter",
-                "dar",
-                "tomar",
-                "comprar",
-                "vender",
-            ],
-        }
-
-        if language.lower() not in sample_words:
-            raise ValueError(
-                f"Language '{language}' not supported. Available: {list(sample_words.keys())}"
-            )
-
-        return sample_words[language.lower()]
+    def _get_builtin_wordlist(self, language: str) -> Tuple[str, ...]:
+        """Fallback to the built-in word lists in wordlists/, one word per line."""
+        return _read_builtin_wordlist(language.lower())
 
     def find_most_similar_word(
-        self, target_word: str, word_list: List[str], force_fuzzy: bool = True
+        self,
+        target_word: str,
+        word_list: List[str],
+        force_fuzzy: bool = True,
+        index: Optional[PhoneticIndex] = None,
     ) -> Tuple[str, float]:
-        """Find the most phonetically similar word in the given word list."""
-        best_match = ""
-        best_distance = float("inf")
+        """Find the most phonetically similar word in the given word list.
+
+        `index` may hold the precomputed PhoneticIndex of `word_list`
+        (see `_encoded_word_list`); otherwise it is built on the fly.
+        """
+        if index is None:
+            index = self.build_phonetic_index(word_list)
+
+        if not force_fuzzy:
+            # The word itself is the closest possible match; its first
+            # occurrence is what scoring the whole list would return
+            hits = np.flatnonzero(index.lowered == target_word.lower())
+            if hits.size:
+                return index.words[hits[0]], 1.0
+
+        distances = self._bucketed_distances(target_word, index, force_fuzzy)
+        return self._closest(distances, index)
+
+    def _closest(
+        self, distances: np.ndarray, index: PhoneticIndex
+    ) -> Tuple[str, float]:
+        """Return the word with the smallest distance and its similarity."""
+        if not len(distances):
+            return "", 1 - float("inf")
 
-        for word in word_list:
-            if force_fuzzy and word.lower() == target_word.lower():
-                continue
+        # argmin returns the first minimum, matching the old strict-< scan
+        best = int(np.argmin(distances))
+        best_distance = float(distances[best])
+        if best_distance == float("inf"):
+            return "", 1 - best_distance
 
-            distance = self.phonetic_distance(target_word, word)
-            if distance < best_distance:
-                best_distance = distance
-                best_match = word
+        return index.words[best], 1 - best_distance
 
-        return best_match, 1 - best_distance
+    def find_most_similar_words(
+        self,
+        target_words: List[str],
+        index: PhoneticIndex,
+        force_fuzzy: bool = True,
+    ) -> List[Tuple[str, float]]:
+        """Batch form of find_most_similar_word for several targets at once.
+
+        Each string-similarity term is computed for a whole batch of targets
+        in a single cdist call instead of one call per target.
+        """
+        results = []
+        for start in range(0, len(target_words), _MATCH_BATCH_SIZE):
+            batch = target_words[start : start + _MATCH_BATCH_SIZE]
+            lowered, soundexes, metaphones = map(list, zip(*map(_encode, batch)))
+
+            soundex_sim = _ratio_matrix(soundexes, index.soundex_codes)
+            metaphone_sim = _ratio_matrix(metaphones, index.metaphone)
+            string_sim = _ratio_matrix(lowered, index.lowered)
+
+            for row, w in enumerate(lowered):
+                distances = _combine_scores(
+                    soundex_sim[row][index.soundex_inverse],
+                    metaphone_sim[row],
+                    string_sim[row],
+                    index.lengths,
+                    len(w),
+                )
+                if force_fuzzy:
+                    distances[string_sim[row] == 1.0] = np.inf
+                results.append(self._closest(distances, index))
+        return results
+
+    def _bucketed_distances(
+        self, target_word: str, index: PhoneticIndex, exclude_identical: bool
+    ) -> np.ndarray:
+        """Phonetic distances to an index, skipping words that cannot be closest.
+
+        Words sharing the target's first Soundex letter are scored first. Any
+        other word has a Soundex similarity of at most 0.75 and a spelling
+        similarity bounded by its length, so only those whose lower bound
+        does not exceed the best distance found so far are scored as well.
+        The rest are left at infinity, which does not change the minimum.
+        """
+        target = target_word.lower()
+        bucket = index.buckets.get(_soundex(target)[0])
+        if bucket is None or len(bucket) == len(index.words):
+            return self.phonetic_distances(target_word, index, exclude_identical)
+
+        distances = np.full(len(index.words), np.inf)
+        distances[bucket] = self.phonetic_distances(
+            target_word, index, exclude_identical, candidates=bucket
+        )
+        best = distances[bucket].min()
+
+        target_length = len(target)
+        lengths = index.lengths
+        max_string_sim = 2 * np.minimum(lengths, target_length) / np.maximum(
+            lengths + target_length, 1
+        )
+        len_penalty = np.abs(lengths - target_length) / np.maximum(
+            np.maximum(lengths, target_length), 1
+        )
+        lower_bound = 0.3 - max_string_sim * 0.2 + len_penalty * 0.1
+
+        others = lower_bound <= best + 1e-9
+        others[bucket] = False
+        rest = np.flatnonzero(others)
+        if len(rest):
+            distances[rest] = self.phonetic_distances(
+                target_word, index, exclude_identical, candidates=rest
+            )
+        return distances
+
+    def _best_match(self, target: str, language: str) -> Tuple[str, float]:
+        """Closest word to a lowercased `target` (other than itself) in a language.
+
+        Results are memoized per (target, language); see _prefetch_matches.
+        """
+        key = (target, language)
+        with self._match_lock:
+            match = self._match_cache.get(key)
+        if match is None:
+            words, index = self._encoded_word_list(language)
+            match = self.find_most_similar_word(
+                target, words, force_fuzzy=True, index=index
+            )
+            with self._match_lock:
+                self._match_cache[key] = match
+        return match
+
+    def _prefetch_matches(self, targets: List[str], language: str) -> List[str]:
+        """Compute the best matches of many lowercased words in one batch.
+
+        Words not yet memoized are scored together and stored, so the
+        _best_match calls that follow are cache hits. Returns the matches.
+        """
+        with self._match_lock:
+            cache = self._match_cache
+            missing = [t for t in dict.fromkeys(targets) if (t, language) not in cache]
+        if missing:
+            _, index = self._encoded_word_list(language)
+            matches = self.find_most_similar_words(missing, index, force_fuzzy=True)
+            with self._match_lock:
+                for target, match in zip(missing, matches):
+                    self._match_cache[(target, language)] = match
+        return [self._best_match(t, language)[0] for t in targets]
 
     def simple_translate(self, word: str, from_lang: str, to_lang: str) -> str:
-        """Translation using deep-translator library with fallback to built-in dictionary."""
+        """Translation using deep-translator library with fallback to built-in dictionary.
+
+        Results are memoized per (word, from_lang, to_lang). Fallback results,
+        given while the translator is unreachable, are not memoized and the
+        translator is tried again on the next call.
+        """
+        return self._translate_word(word, from_lang, to_lang)[0]
+
+    def _translate_word(
+        self, word: str, from_lang: str, to_lang: str
+    ) -> Tuple[str, bool]:
+        """simple_translate, also returning False if the translator failed."""
+        key = (word, from_lang, to_lang)
+        with self._translation_lock:
+            translation = self._translation_cache.get(key)
+        if translation is not None:
+            return translation, True
         try:
-            from deep_translator import GoogleTranslator
-
-            lang_map = {
-                "english": "en",
-                "spanish": "es",
-                "french": "fr",
-                "german": "de",
-                "italian": "it",
-                "portuguese": "pt",
-                "dutch": "nl",
-            }
-            source = lang_map.get(from_lang.lower(), "auto")
-            target = lang_map.get(to_lang.lower(), "en")
-
-            translator = GoogleTranslator(source=source, target=target)
-            result = translator.translate(word)
-            return result
-
+            translation = self._translate(word, from_lang, to_lang)
         except Exception:
-            # Extended translation dictionary for direct language pairs
-            translations = {
-                ("spanish", "french"): {
-                    "casa": "maison",
-                    "agua": "eau",
-                    "fuego": "feu",
-                    "árbol": "arbre",
-                    "libro": "livre",
-                    "amigo": "ami",
-                    "perro": "chien",
-                    "gato": "chat",
-                    "rojo": "rouge",
-                    "azul": "bleu",
-                    "verde": "vert",
-                    "grande": "grand",
-                },
-                ("french", "spanish"): {
-                    "maison": "casa",
-                    "eau": "agua",
-                    "feu": "fuego",
-                    "arbre": "árbol",
-                    "livre": "libro",
-                    "ami": "amigo",
-                    "chien": "perro",
-                    "chat": "gato",
-                    "rouge": "rojo",
-                    "bleu": "azul",
-                    "vert": "verde",
-                    "grand": "grande",
-                },
-                ("spanish", "italian"): {
-                    "casa": "casa",
-                    "agua": "acqua",
-                    "fuego": "fuoco",
-                    "árbol": "albero",
-                    "libro": "libro",
-                    "amigo": "amico",
-                    "perro": "cane",
-                    "gato": "gatto",
-                    "rojo": "rosso",
-                    "azul": "blu",
-                    "verde": "verde",
-                    "grande": "grande",
-                },
-                ("italian", "spanish"): {
-                    "casa": "casa",
-                    "acqua": "agua",
-                    "fuoco": "fuego",
-                    "albero": "árbol",
-                    "libro": "libro",
-                    "amico": "amigo",
-                    "cane": "perro",
-                    "gatto": "gato",
-                    "rosso": "rojo",
-                    "blu": "azul",
-                    "verde": "verde",
-                    "grande": "grande",
-                },
-                ("german", "french"): {
-                    "haus": "maison",
-                    "wasser": "eau",
-                    "feuer": "feu",
-                    "baum": "arbre",
-                    "buch": "livre",
-                    "freund": "ami",
-                    "hund": "chien",
-                    "katze": "chat",
-                    "rot": "rouge",
-                    "blau": "bleu",
-                    "grün": "vert",
-                    "groß": "grand",
-                },
-                ("french", "german"): {
-                    "maison": "haus",
-                    "eau": "wasser",
-                    "feu": "feuer",
-                    "arbre": "baum",
-                    "livre": "buch",
-                    "ami": "freund",
-                    "chien": "hund",
-                    "chat": "katze",
-                    "rouge": "rot",
-                    "bleu": "blau",
-                    "vert": "grün",
-                    "grand": "groß",
-                },
-            }
+            key = (from_lang.lower(), to_lang.lower(), word.lower())
+            return _FALLBACK_TRANSLATIONS.get(key, f"[untranslated: {word}]"), False
+        with self._translation_lock:
+            self._translation_cache[key] = translation
+        return translation, True
+
+    def _translate(self, word: str, from_lang: str, to_lang: str) -> str:
+        from deep_translator import GoogleTranslator
 
-            key = (from_lang.lower(), to_lang.lower())
-            if key in translations and word.lower() in translations[key]:
-                return translations[key][word.lower()]
+        source = _TRANSLATOR_CODES.get(from_lang.lower(), "auto")
+        target = _TRANSLATOR_CODES.get(to_lang.lower(), "en")
 
-            return f"[untranslated: {word}]"
+        # A fresh instance per call: translate() stores the text in
+        # instance state, so one translator cannot serve several threads
+        translator = GoogleTranslator(source=source, target=target)
+        with _translation_slots:
+            return translator.translate(word)
 
     def transform_direct_fuzzy(self, word: str, lang_a: str, lang_b: str) -> dict:
         """Direct fuzzy transformation: WORD_A -> B (fuzzy) -> A (fuzzy)"""
-        word_list_a = self.load_word_list(lang_a)
-        word_list_b = self.load_word_list(lang_b)
 
         # Step 1: Find phonetically similar word in language B
-        matched_word_b, similarity_b = self.find_most_similar_word(
-            word, word_list_b, force_fuzzy=True
-        )
+        matched_word_b, similarity_b = self._best_match(word.lower(), lang_b)
 
         # Step 2: Find phonetically similar word back in language A
-        final_word_a, similarity_final = self.find_most_similar_word(
-            matched_word_b, word_list_a, force_fuzzy=True
+        final_word_a, similarity_final = self._best_match(
+            matched_word_b.lower(), lang_a
         )
 
         return {
@@ -1610,15 +871,12 @@ class Hazer:
 
     def transform_direct_translate(self, word: str, lang_a: str, lang_b: str) -> dict:
         """Direct transformation with translation: WORD_A -> B (fuzzy) -> A (translate)"""
-        word_list_b = self.load_word_list(lang_b)
 
         # Step 1: Find phonetically similar word in language B
-        matched_word_b, similarity_b = self.find_most_similar_word(
-            word, word_list_b, force_fuzzy=True
-        )
+        matched_word_b, similarity_b = self._best_match(word.lower(), lang_b)
 
         # Step 2: Translate back to language A
-        final_word = self.simple_translate(matched_word_b, lang_b, lang_a)
+        final_word, translated = self._translate_word(matched_word_b, lang_b, lang_a)
 
         return {
             "original_input": word,
@@ -1628,9 +886,22 @@ class Hazer:
             "final_translation": final_word,
             "direct_chain": f"{word} → {matched_word_b} → {final_word}",
             "similarity_score": similarity_b,
+            # The translator was unreachable and a fallback was used
+            "degraded": not translated,
         }
 
     def generate_final_text(self, text, lang_a):
+        return self._final_text(text, lang_a)[0]
+
+    def _final_text(self, text: str, lang_a: str) -> Tuple[str, bool]:
+        """generate_final_text, also returning False if the API call failed."""
+        if len(text.split()) < 3:
+            return text, True
+        key = (text, lang_a)
+        with self._final_text_lock:
+            cached = self._final_text_cache.get(key)
+        if cached is not None:
+            return cached, True
         prompt = (
             "could you build a MINIMALLY coherent phrase in "
             + lang_a
@@ -1639,57 +910,94 @@ class Hazer:
             + "Just add (if needed) the basic semantic connectors and reordering that could give narrative sense to the text in said language. DO NOT ADD NOUNS."
             + 'Please JUST the resulting text, without quotations, do not introduce the text or say ANYTHING ELSE suchas "Here s a coherent phrase using those elements: balala. Always give back the same result for the same initial input."'
         )
-        if len(text.split()) < 3:
-            return text
-        else:
-            try:
-                api_key = get_api_key()
-                anthropic = Anthropic(api_key=api_key)
-                response = anthropic.messages.create(
-                    model="claude-sonnet-4-20250514",
-                    max_tokens=50,
-                    temperature=1.0,
-                    messages=[{"role": "user", "content": prompt}],
-                )
-                return response.content[0].text
-            except Exception as e:
-                print(f"Error: {e}")
-                return text
+        try:
+            client = self._anthropic_client()
+        except ValueError:
+            # No API key configured: a fixed setting, not a failure to retry,
+            # so the unpolished text is the final result
+            return text, True
+        try:
+            response = client.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=50,
+                temperature=1.0,
+                messages=[{"role": "user", "content": prompt}],
+            )
+            result = response.content[0].text
+        except Exception as e:
+            print(f"Error: {e}")
+            # Not cached, so the next call retries the API
+            return text, False
+        with self._final_text_lock:
+            self._final_text_cache[key] = result
+        return result, True
+
+    def _anthropic_client(self) -> Anthropic:
+        """Return the Anthropic client used by generate_final_text."""
+        with self._anthropic_lock:
+            if self._anthropic is None:
+                self._anthropic = Anthropic(api_key=get_api_key())
+            return self._anthropic
+
+    def _map_words(self, transform, words: List[str]) -> Dict[str, dict]:
+        """Run `transform` once per distinct word, concurrently.
+
+        Translating a word is a network round trip, so the words of a
+        sentence are translated in parallel instead of one after another.
+        """
+        unique = list(dict.fromkeys(words))
+        if len(unique) < 2:
+            return {word: transform(word) for word in unique}
+        workers = min(_WORD_WORKERS, len(unique))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(unique, executor.map(transform, unique)))
 
     def haze(
         self, sentence: str, lang_a: str, lang_b: str, method: str = "fuzzy"
     ) -> dict:
         """Transform an entire sentence word by word between any two languages."""
-        words = re.findall(r"\b\w+\b|\W+", sentence)
+        tokens = _TOKEN_RE.findall(sentence)
+        word_tokens = [item for item, _ in tokens if item]
+
+        # Score every word of the sentence against the word lists in batches
+        matched_b = self._prefetch_matches([w.lower() for w in word_tokens], lang_b)
+        if method == "fuzzy":
+            # Every match is memoized by now, so this needs no threads
+            self._prefetch_matches([w.lower() for w in matched_b], lang_a)
+            results = {
+                item: self.transform_direct_fuzzy(item, lang_a, lang_b)
+                for item in dict.fromkeys(word_tokens)
+            }
+        else:
+            results = self._map_words(
+                lambda item: self.transform_direct_translate(item, lang_a, lang_b),
+                word_tokens,
+            )
 
         transformed_words = []
         word_details = []
 
-        for item in words:
-            if re.match(r"\w+", item):
+        for item, separator in tokens:
+            if item:
+                result = results[item]
                 if method == "fuzzy":
-                    result = self.transform_direct_fuzzy(item, lang_a, lang_b)
                     transformed_word = result["step2_final_lang_a"]
                     chain = result["direct_fuzzy_chain"]
                 else:
-                    result = self.transform_direct_translate(item, lang_a, lang_b)
                     transformed_word = result["final_translation"]
                     chain = result["direct_chain"]
 
                 transformed_words.append(transformed_word)
                 word_details.append(
-                    {
-                        "original": item,
-                        "transformed": transformed_word,
-                        "chain": chain,
-                        "method": method,
-                    }
+                    WordDetail(item, transformed_word, chain, method)
                 )
             else:
-                transformed_words.append(item)
+                transformed_words.append(separator)
 
         transformed_sentence = "".join(transformed_words)
-        transformed_sentence = self.generate_final_text(transformed_sentence, lang_a)
+        transformed_sentence, finalized = self._final_text(
+            transformed_sentence, lang_a
+        )
 
         return {
             "original_sentence": sentence,
@@ -1697,21 +1005,23 @@ class Hazer:
             "method": method,
             "language_route": f"{lang_a} → {lang_b} → {lang_a}",
             "word_transformations": word_details,
-            "word_count": len([w for w in word_details]),
+            "word_count": len(word_details),
+            # A translation or the final LLM pass fell back because the
+            # service failed; the result should not be cached
+            "degraded": not finalized
+            or any(result.get("degraded", False) for result in results.values()),
         }
 
     def fuzzy_haze(self, word: str, lang_a: str, lang_b: str) -> dict:
         """Fuzzy transformation then real translation: WORD_A → B (fuzzy) → A (translate), fallback to fuzzy if translation fails"""
-        word_list_a = self.load_word_list(lang_a)
-        word_list_b = self.load_word_list(lang_b)
 
         # Step 1: Find phonetically similar word in language B
-        matched_word_b, similarity_b = self.find_most_similar_word(
-            word, word_list_b, force_fuzzy=True
-        )
+        matched_word_b, similarity_b = self._best_match(word.lower(), lang_b)
 
         # Step 2: Try to translate the fuzzy match back to language A
-        translated_word = self.simple_translate(matched_word_b, lang_b, lang_a)
+        translated_word, translated = self._translate_word(
+            matched_word_b, lang_b, lang_a
+        )
 
         # Check if translation failed (returns [untranslated: word] pattern)
         if (
@@ -1719,8 +1029,8 @@ class Hazer:
             or translated_word == matched_word_b
         ):
             # Translation failed, fall back to fuzzy matching
-            final_word, similarity_final = self.find_most_similar_word(
-                matched_word_b, word_list_a, force_fuzzy=True
+            final_word, similarity_final = self._best_match(
+                matched_word_b.lower(), lang_a
             )
             method_used = "fuzzy_fallback"
             final_similarity = similarity_final
@@ -1740,38 +1050,66 @@ class Hazer:
             "hybrid_chain": f"{word} → {matched_word_b} → {final_word} ({method_used})",
             "fuzzy_similarity": similarity_b,
             "final_similarity": final_similarity,
+            # The translator was unreachable and a fallback was used
+            "degraded": not translated,
         }
 
-    def hybrid_haze(self, sentence: str, lang_a: str, lang_b: str) -> dict:
-        """Transform sentence using fuzzy then translate approach."""
-        words = re.findall(r"\b\w+\b|\W+", sentence)
+    def hybrid_haze(
+        self,
+        sentence: str,
+        lang_a: str,
+        lang_b: str,
+        memo: Optional[Dict[str, dict]] = None,
+        finalize: bool = True,
+    ) -> dict:
+        """Transform sentence using fuzzy then translate approach.
+
+        ``memo`` maps words to their ``fuzzy_haze`` results for this language
+        pair; words found there are not transformed again and new results are
+        added to it. With ``finalize=False`` the sentence is returned without
+        the generate_final_text pass.
+        """
+        tokens = _TOKEN_RE.findall(sentence)
+        results = {} if memo is None else memo
+        word_tokens = [item for item, _ in tokens if item and item not in results]
+
+        # Score every new word of the sentence against language B in batches
+        self._prefetch_matches([w.lower() for w in word_tokens], lang_b)
+        results.update(
+            self._map_words(
+                lambda item: self.fuzzy_haze(item, lang_a, lang_b), word_tokens
+            )
+        )
 
         transformed_words = []
         word_details = []
 
-        for item in words:
-            if re.match(r"\w+", item):
-                result = self.fuzzy_haze(item, lang_a, lang_b)
+        for item, separator in tokens:
+            if item:
+                result = results[item]
                 transformed_word = result["step2_result"]  # Fixed key name
                 chain = result["hybrid_chain"]
 
                 transformed_words.append(transformed_word)
                 word_details.append(
-                    {
-                        "original": item,
-                        "transformed": transformed_word,
-                        "chain": chain,
-                        "method": "fuzzy_then_translate",
-                        "fallback_used": result[
-                            "method_used"
-                        ],  # Track if fallback was used
-                    }
+                    WordDetail(
+                        item,
+                        transformed_word,
+                        chain,
+                        "fuzzy_then_translate",
+                        # Track if fallback was used
+                        fallback_used=result["method_used"],
+                    )
                 )
             else:
-                transformed_words.append(item)
+                transformed_words.append(separator)
 
         transformed_sentence = "".join(transformed_words)
-        transformed_sentence = self.generate_final_text(transformed_sentence, lang_a)
+        finalized = True
+        if finalize:
+            transformed_sentence, finalized = self._final_text(
+                transformed_sentence, lang_a
+            )
 
         return {
             "original_sentence": sentence,
@@ -1779,7 +1117,11 @@ class Hazer:
             "method": "fuzzy_then_translate",
             "language_route": f"{lang_a} → {lang_b} → {lang_a} ",
             "word_transformations": word_details,
-            "word_count": len([w for w in word_details]),
+            "word_count": len(word_details),
+            # A translation or the final LLM pass fell back because the
+            # service failed; the result should not be cached
+            "degraded": not finalized
+            or any(results[item]["degraded"] for item, _ in tokens if item),
         }
 
     def rehaze(
@@ -1790,31 +1132,31 @@ class Hazer:
         max_iterations: int = 20,
         similarity_threshold: float = 0.96,
     ) -> dict:
-        """Transform text iteratively until it stabilizes or max iterations reached."""
+        """Transform text iteratively until it stabilizes or max iterations reached.
+
+        Iterations skip generate_final_text; it runs once on the last text,
+        which is returned as ``final_iteration_text``.
+        """
 
         iterations = []
         current_text = initial_text
+        # Words repeat heavily between iterations, and a failed translation is
+        # not kept by simple_translate, so share one word memo for the run
+        word_memo: Dict[str, dict] = {}
 
         for i in range(max_iterations):
             # Transform current text
-            transformed_result = self.hybrid_haze(current_text, lang_a, lang_b)
+            transformed_result = self.hybrid_haze(
+                current_text, lang_a, lang_b, memo=word_memo, finalize=False
+            )
             text = transformed_result["transformed_sentence"]
-            text = re.sub(r"\byao\b", "y", text)
-            text = re.sub(r"\bnoo\b", "no", text)
-            text = re.sub(
-                r"\byou\b(?![a-z])", "y", text
-            )  # "you" when standalone (not part of longer word)
-            text = re.sub(r"\bdee\b", "de", text)
-            text = re.sub(r"\baii\b", "ahí", text)
-            text = re.sub(r"\baii\b", "ahí", text)
-            text = re.sub(r"\bmaui\b", "mi", text)
-            text = re.sub(r"\bai\b", "a", text)
+            text = _REHAZE_RE.sub(lambda m: _REHAZE_MAP[m.group(1)], text)
 
             # Calculate similarity with previous iteration
-            if i > 0:
-                similarity = difflib.SequenceMatcher(
-                    None, current_text.lower(), text.lower()
-                ).ratio()
+            if i > 0 and text == current_text:
+                similarity = 1.0
+            elif i > 0:
+                similarity = _ratio(current_text.lower(), text.lower())
             else:
                 similarity = 0.0
 
@@ -1824,7 +1166,11 @@ class Hazer:
                 "input_text": current_text,
                 "output_text": text,
                 "similarity_to_previous": similarity,
-                "word_transformations": transformed_result["word_transformations"],
+                # Plain dicts, so rehaze results can be serialized as JSON
+                "word_transformations": [
+                    detail.to_dict()
+                    for detail in transformed_result["word_transformations"]
+                ],
                 "transformation_count": len(transformed_result["word_transformations"]),
             }
             iterations.append(iteration_data)
@@ -1839,10 +1185,16 @@ class Hazer:
         # Compile all iterations into final text
         final_text = "\n".join([iter_data["output_text"] for iter_data in iterations])
 
+        # A single LLM pass on the text the loop settled on
+        final_iteration_text = self.generate_final_text(current_text, lang_a)
+        final_iteration_text = _REHAZE_RE.sub(
+            lambda m: _REHAZE_MAP[m.group(1)], final_iteration_text
+        )
+
         return {
             "initial_text": initial_text,
             "final_text": final_text,
-            "final_iteration_text": current_text,
+            "final_iteration_text": final_iteration_text,
             "iterations": iterations,
             "total_iterations": len(iterations),
             "converged": len(iterations) < max_iterations,
@@ -1880,12 +1232,12 @@ class PhoneticFuzzer:
             for word_detail in result["word_transformations"]:
                 variations = [
                     {
-                        "text": word_detail["original"],
+                        "text": word_detail.original,
                         "similarity": 1.0,
                         "confidence": "Original",
                     },
                     {
-                        "text": word_detail["transformed"],
+                        "text": word_detail.transformed,
                         "similarity": 0.8,  # Approximate similarity
                         "confidence": "High",
                     },
@@ -1893,9 +1245,9 @@ class PhoneticFuzzer:
 
                 processed_words.append(
                     {
-                        "original": word_detail["original"],
+                        "original": word_detail.original,
                         "variations": variations,
-                        "transformation_chain": word_detail["chain"],
+                        "transformation_chain": word_detail.chain,
                     }
                 )
 